@@ -2,11 +2,13 @@ import requests
 import base64
 import streamlit as st
 import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import PatternFill, numbers, Border, Side
-from openpyxl.utils import get_column_letter
+import numpy as np
+import xlsxwriter
+from xlsxwriter.utility import xl_col_to_name
 from datetime import datetime
+from html import escape
 import io
+import tempfile
 
 
 
@@ -14,12 +16,29 @@ st.set_page_config(layout="wide")
 
 POWER_AUTOMATE_URL = st.secrets["power_automate"]["url"]
 
+NORM_COLS = ["type", "supplier", "brand", "code", "description", "Power Type"]
+CATEGORY_COLS = ["type", "supplier", "brand", "code", "Power Type"]
+
+
+def normalize_columns(df):
+    # Arrow-backed strings strip in pyarrow's native trim kernel, straight
+    # over the offsets/data buffers, with no per-value Python calls
+    present = [c for c in NORM_COLS if c in df.columns]
+    df[present] = df[present].astype("string[pyarrow]").apply(lambda s: s.str.strip())
+    return df
+
+
 # -------------------------------------------------
 # SESSION STATE
 # -------------------------------------------------
 if "df" not in st.session_state:
     st.session_state.df = None
 
+# Per-user HTTP session, so repeat submissions reuse the TCP/TLS connection
+# to Power Automate without sharing cookies or threads across users
+if "http_session" not in st.session_state:
+    st.session_state.http_session = requests.Session()
+
 # -------------------------------------------------
 # HEADER
 # -------------------------------------------------
@@ -43,13 +62,14 @@ if pdfs:  # at least one file uploaded
 
             files_payload = []
             for pdf in pdfs:
-                encoded = base64.b64encode(pdf.read()).decode("ascii")
+                # getvalue() ignores the read position, so reruns never send empty files
+                encoded = base64.b64encode(pdf.getvalue()).decode("ascii")
                 files_payload.append({
                     "name": pdf.name,
                     "content": encoded
                 })
 
-            response = requests.post(
+            response = st.session_state.http_session.post(
                 POWER_AUTOMATE_URL,
                 json={"files": files_payload},
                 headers={
@@ -67,16 +87,13 @@ if pdfs:  # at least one file uploaded
         df = pd.read_csv(io.BytesIO(csv_bytes))
 
         # 🔑 HANDOFF POINT — everything else already works
-        for col in ["type", "supplier", "brand", "code", "description", "Power Type"]:
-            if col in df.columns:
-                df[col] = df[col].astype(str).str.strip()
+        df = normalize_columns(df)
 
         st.session_state.df = df
         st.session_state.current_job_path = None
         st.session_state.job_loaded_from_queue = False
 
         st.success(f"✅ CSV generated from {len(pdfs)} PDF(s) and loaded")
-        st.rerun()
 else:
     st.info("Upload 1 or more PDFs to start processing")
 
@@ -94,12 +111,10 @@ if uploaded_file:
     else:
         df = pd.read_excel(uploaded_file)
 
-    for col in ["type", "supplier", "brand", "code", "description", "Power Type"]:
-        if col in df.columns:
-            df[col] = df[col].astype(str).str.strip()
+    df = normalize_columns(df)
 
     # 🔹 Override queue state
-    st.session_state.df = df.copy()
+    st.session_state.df = df
     st.session_state.current_job_path = None
     st.session_state.job_loaded_from_queue = False
 
@@ -122,17 +137,106 @@ if st.session_state.df is not None:
 # TAX INPUT
 # -------------------------------------------------
 st.subheader("💲 Tax Settings")
-tax_percent = st.number_input("Tax Percentage", min_value=0.0, value=12.0)
+# Inside a form the preview only rebuilds when the new tax is applied,
+# not on every keystroke or spinner click
+with st.form("tax_form"):
+    tax_percent = st.number_input("Tax Percentage", min_value=0.0, value=12.0)
+    st.form_submit_button("Apply tax")
 
 # -------------------------------------------------
 # HTML PREVIEW (EXCEL-STYLE)
 # -------------------------------------------------
 st.subheader("👀 Price Analysis Preview (HTML Table)")
 
-def generate_html_table(df, tax_percent):
+def group_line_items(df):
+    # Low-cardinality keys as categoricals make the masks and groupbys below
+    # compare integer codes; the editable session frame keeps plain strings
+    df = df.astype({c: "category" for c in CATEGORY_COLS if c in df.columns})
+
+    main_items = df[
+        (df["type"] == "item") &
+        df["Power Type"].notna() &
+        (df["Power Type"] != "")
+    ]
+    groups = main_items[["code", "Power Type"]].drop_duplicates()
+
+    # Subitems without a Power Type apply to every power type of their code
+    # _row keeps the source order through the merge below
+    line_items = df[df["type"].isin(["item", "subitem"])]
+    line_items = line_items.assign(_row=np.arange(len(line_items)))
+    has_power_type = line_items["Power Type"].notna() & (line_items["Power Type"] != "")
+    line_items = pd.concat([
+        line_items[has_power_type],
+        line_items[~has_power_type].drop(columns="Power Type").merge(groups, on="code"),
+    ]).sort_values("_row", kind="stable")
+
+    return groups, line_items
+
+
+# One entry per (code, Power Type) group, shared by the HTML preview and the
+# Excel writer: (code, power_type, brand, suppliers, descriptions, prices,
+# has_subitems), where prices holds one row per description in supplier order
+@st.cache_data(max_entries=8, show_spinner=False)
+def plan_groups(df):
+    keys = ["code", "Power Type"]
+    groups, line_items = group_line_items(df)
+
+    # Same shape as pivot_table, but rows without a price or description are
+    # kept; pivot_table(dropna=False) would expand to every level combination
+    price_pivot = (
+        line_items
+        .groupby(keys + ["description", "supplier"], sort=False, observed=True, dropna=False)["price"]
+        .first()
+        .unstack("supplier")
+    )
+    grouped = line_items.groupby(keys, sort=False, observed=True)
+    supplier_map = grouped["supplier"].unique()
+    desc_map = grouped["description"].unique()
+    brand_map = (
+        line_items[line_items["type"] == "item"]
+        .groupby(keys, sort=False, observed=True)["brand"]
+        .first()
+    )
+    subitem_groups = set(
+        line_items.loc[line_items["type"] == "subitem", keys].itertuples(index=False, name=None)
+    )
+
+    plan = []
+    for code, power_type in groups.values:
+
+        suppliers = supplier_map.loc[(code, power_type)]
+        descriptions = desc_map.loc[(code, power_type)]
+
+        group_index = pd.MultiIndex.from_arrays([
+            [code] * len(descriptions),
+            [power_type] * len(descriptions),
+            descriptions,
+        ])
+        prices = (
+            price_pivot
+            .reindex(index=group_index, columns=suppliers)
+            .fillna(0)
+            .astype(float)
+        )
+
+        plan.append((
+            code,
+            power_type,
+            brand_map.loc[(code, power_type)],
+            tuple(suppliers),
+            tuple(descriptions),
+            tuple(prices.itertuples(index=False, name=None)),
+            (code, power_type) in subitem_groups,
+        ))
+
+    return plan
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def generate_html_table(plan, tax_percent):
     tax_rate = tax_percent / 100
 
-    html = """
+    parts = ["""
     <div style="overflow-x:auto;">
     <style>
         table {
@@ -162,105 +266,68 @@ def generate_html_table(df, tax_percent):
             background-color: #fce4d6;
             font-weight: bold;
         }
-    </style>
-    """
 
-    main_items = df[
-        (df["type"] == "item") &
-        df["Power Type"].notna() &
-        (df["Power Type"] != "")
-    ]
+        /* Off-screen groups skip layout and paint until scrolled into view */
+        .lazy {
+            content-visibility: auto;
+            contain-intrinsic-size: auto 240px;
+        }
+    </style>
+    """]
 
-    for code, power_type in main_items[["code", "Power Type"]].drop_duplicates().values:
+    for code, power_type, brand, suppliers, descriptions, prices, _ in plan:
 
-        items_for_code = df[
-            (df["code"] == code) &
-            (
-                (df["Power Type"] == power_type) |
-                (df["Power Type"].isna()) |
-                (df["Power Type"] == "")
-            ) &
-            (df["type"].isin(["item", "subitem"]))
-        ]
+        # No supplier quote or description yet; the Excel export keeps the
+        # group, but the preview doesn't render an empty table for it
+        if pd.isna(list(suppliers)).all() or pd.isna(list(descriptions)).all():
+            continue
 
-        suppliers = items_for_code["supplier"].unique()
-        brand = items_for_code[items_for_code["type"] == "item"].iloc[0]["brand"]
-        descriptions = items_for_code["description"].unique()
+        totals = [sum(column) for column in zip(*prices)]
+        rows = zip(descriptions, prices)
 
         body_rows = len(descriptions) + 2  # items + tax + total
 
-        html += "<table>"
+        parts.append("<div class='lazy'><table>")
 
         # HEADER
-        html += "<tr>"
-        html += "<th>Details</th><th></th><th>QTY</th><th>Items</th>"
-        for s in suppliers:
-            html += f"<th>{s}</th>"
-        html += "</tr>"
-
-        totals = {s: 0 for s in suppliers}
+        header_cells = "".join(f"<th>{escape(str(s))}</th>" for s in suppliers)
+        parts.append(
+            "<tr><th>Details</th><th></th><th>QTY</th><th>Items</th>"
+            f"{header_cells}</tr>"
+        )
 
         # FIRST ITEM ROW (with DETAILS)
-        first_desc = descriptions[0]
+        first_desc, first_prices = next(rows)
+        price_cells = "".join(f"<td>${price:,.2f}</td>" for price in first_prices)
 
-        html += "<tr>"
-        html += f"""
+        parts.append(f"""<tr>
             <td rowspan="{body_rows}">
-                <b>Brand</b><br>{brand}<br><br>
-                <b>Code</b><br>{code}<br><br>
-                <b>Power Type</b><br>{power_type}
+                <b>Brand</b><br>{escape(str(brand))}<br><br>
+                <b>Code</b><br>{escape(str(code))}<br><br>
+                <b>Power Type</b><br>{escape(str(power_type))}
             </td>
             <td rowspan="{body_rows}"></td>
             <td>1</td>
-            <td>{first_desc}</td>
-        """
-
-        for s in suppliers:
-            row = items_for_code[
-                (items_for_code["supplier"] == s) &
-                (items_for_code["description"] == first_desc)
-            ]
-            price = float(row["price"].iloc[0]) if not row.empty else 0
-            totals[s] += price
-            html += f"<td>${price:,.2f}</td>"
-
-        html += "</tr>"
+            <td>{escape(str(first_desc))}</td>
+        {price_cells}</tr>""")
 
         # REMAINING ITEM ROWS
-        for desc in descriptions[1:]:
-            html += "<tr>"
-            html += f"<td>1</td><td>{desc}</td>"
-
-            for s in suppliers:
-                row = items_for_code[
-                    (items_for_code["supplier"] == s) &
-                    (items_for_code["description"] == desc)
-                ]
-                price = float(row["price"].iloc[0]) if not row.empty else 0
-                totals[s] += price
-                html += f"<td>${price:,.2f}</td>"
-
-            html += "</tr>"
+        for desc, row_prices in rows:
+            price_cells = "".join(f"<td>${price:,.2f}</td>" for price in row_prices)
+            parts.append(f"<tr><td>1</td><td>{escape(str(desc))}</td>{price_cells}</tr>")
 
         # TAX ROW
-        html += "<tr>"
-        html += "<td></td><td><b>Tax</b></td>"
-        for _ in suppliers:
-            html += f"<td>{tax_percent:.2f}%</td>"
-        html += "</tr>"
+        tax_cells = f"<td>{tax_percent:.2f}%</td>" * len(suppliers)
+        parts.append(f"<tr><td></td><td><b>Tax</b></td>{tax_cells}</tr>")
 
         # TOTAL ROW
-        html += "<tr class='total-row'>"
-        html += "<td></td><td>Total</td>"
-        for s in suppliers:
-            total = totals[s] * (1 + tax_rate)
-            html += f"<td>${total:,.2f}</td>"
-        html += "</tr>"
+        total_cells = "".join(f"<td>${total * (1 + tax_rate):,.2f}</td>" for total in totals)
+        parts.append(f"<tr class='total-row'><td></td><td>Total</td>{total_cells}</tr>")
 
-        html += "</table>"
+        parts.append("</table></div>")
 
-    html += "</div>"
-    return html
+    parts.append("</div>")
+    return "".join(parts)
 
 
 # 🔥 RENDER HTML (LIVE, REACTIVE)
@@ -269,8 +336,9 @@ if (
     and st.session_state.df is not None
     and not st.session_state.df.empty
 ):
-    html = generate_html_table(st.session_state.df, tax_percent)
-    st.markdown(html, unsafe_allow_html=True)
+    html = generate_html_table(plan_groups(st.session_state.df), tax_percent)
+    # The iframe keeps the large table out of the app's own DOM
+    st.iframe(html, height=600)
 else:
     st.info("⬆️ Upload or generate data to see the price analysis preview.")
 
@@ -283,130 +351,157 @@ if st.button("Generate Excel File"):
     df = st.session_state.df
     tax_rate = tax_percent / 100
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Items Summary"
-
-    header_fill = PatternFill(start_color="DAE9F8", end_color="DAE9F8", fill_type="solid")
-    total_fill = PatternFill(start_color="FCE4D6", end_color="FCE4D6", fill_type="solid")
-    thin_side = Side(border_style="thin", color="000000")
-
-    start_row_offset = 1
-    start_col_offset = 1
-    current_row = 1
-
-    main_items = df[(df["type"] == "item") & df["Power Type"].notna() & (df["Power Type"] != "")]
-
-    for code, power_type in main_items[["code", "Power Type"]].drop_duplicates().values:
-
-        items_for_code = df[
-            (df["code"] == code) &
-            (
-                (df["Power Type"] == power_type) |
-                (df["Power Type"].isna()) |
-                (df["Power Type"] == "")
-            ) &
-            (df["type"].isin(["item", "subitem"]))
-        ]
-
-        suppliers = items_for_code["supplier"].unique()
-        brand = items_for_code[items_for_code["type"] == "item"].iloc[0]["brand"]
-        descriptions = items_for_code["description"].unique()
-
-        start_row = current_row
-        data_row = start_row + 1
-
-        ws.cell(row=start_row + start_row_offset, column=1 + start_col_offset, value="Details")
-        ws.cell(row=start_row + start_row_offset, column=3 + start_col_offset, value="Image")
-        ws.cell(row=start_row + start_row_offset, column=4 + start_col_offset, value="QTY")
-        ws.cell(row=start_row + start_row_offset, column=5 + start_col_offset, value="Items")
-
-        for i, supplier in enumerate(suppliers):
-            ws.cell(
-                row=start_row + start_row_offset,
-                column=6 + i + start_col_offset,
-                value=supplier
+    # Small workbooks stay in memory; larger ones spill to disk instead of
+    # growing a BytesIO that is then copied again by getvalue()
+    with tempfile.SpooledTemporaryFile(max_size=4 * 1024 * 1024) as output:
+        # Constant-memory mode flushes each row to a temp file once a later row
+        # is written, so each group is laid out in a row buffer first and then
+        # written top to bottom
+        wb = xlsxwriter.Workbook(output, {"constant_memory": True, "strings_to_urls": False})
+        ws = wb.add_worksheet("Items Summary")
+
+        header_fill = "#DAE9F8"
+        total_fill = "#FCE4D6"
+        currency_format = '"$"#,##0.00_-'
+        percentage_format = "0.00%"
+        no_border = (False, False, False, False)
+
+        # One shared format per (fill, number format, border) combination
+        formats = {}
+
+        def cell_format(fill=None, num_format=None, border=no_border):
+            key = (fill, num_format, border)
+            if key not in formats:
+                props = {}
+                if fill:
+                    props.update(bg_color=fill, pattern=1)
+                if num_format:
+                    props["num_format"] = num_format
+                for side, has_side in zip(("top", "bottom", "left", "right"), border):
+                    if has_side:
+                        props[side] = 1
+                        props[f"{side}_color"] = "#000000"
+                formats[key] = wb.add_format(props) if props else None
+            return formats[key]
+
+        start_row_offset = 1
+        start_col_offset = 1
+
+        # Missing values (NaN/<NA>) are left as blank cells
+        def cell(rows, row, column, value=None):
+            target = rows[row].setdefault(column, {})
+            if value is not None and not pd.isna(value):
+                target["value"] = value
+            return target
+
+        # Lays out one group's cells without touching the workbook; the caller
+        # writes them in row order
+        def build_group_rows(group, start_row):
+            code, power_type, brand, suppliers, descriptions, prices, has_subitems = group
+
+            data_row = start_row + 1
+
+            extra_rows = 2 if not has_subitems else 0
+
+            tax_row = data_row + len(descriptions) + extra_rows + start_row_offset
+            total_row = tax_row + 1
+
+            first_row = start_row + start_row_offset
+            last_row = total_row
+            first_col = 1 + start_col_offset
+            last_col = 5 + len(suppliers) + start_col_offset
+
+            rows = {r: {} for r in range(first_row, last_row + 1)}
+
+            cell(rows, start_row + start_row_offset, 1 + start_col_offset, "Details")
+            cell(rows, start_row + start_row_offset, 3 + start_col_offset, "Image")
+            cell(rows, start_row + start_row_offset, 4 + start_col_offset, "QTY")
+            cell(rows, start_row + start_row_offset, 5 + start_col_offset, "Items")
+
+            for i, supplier in enumerate(suppliers):
+                cell(rows, start_row + start_row_offset, 6 + i + start_col_offset, supplier)
+
+            for col in range(1 + start_col_offset, last_col + 1):
+                cell(rows, start_row + start_row_offset, col)["fill"] = header_fill
+
+            cell(rows, data_row + start_row_offset, 1 + start_col_offset, "Brand")
+            cell(rows, data_row + start_row_offset, 2 + start_col_offset, brand)
+
+            cell(rows, data_row + 1 + start_row_offset, 1 + start_col_offset, "Code")
+            cell(rows, data_row + 1 + start_row_offset, 2 + start_col_offset, code)
+
+            cell(rows, data_row + 2 + start_row_offset, 1 + start_col_offset, "Power Type")
+            cell(rows, data_row + 2 + start_row_offset, 2 + start_col_offset, power_type)
+
+            # Price formulas for the whole group, built as one string array
+            qty_letter = xl_col_to_name(4 + start_col_offset - 1)
+            item_rows = np.arange(len(descriptions)) + data_row + start_row_offset
+            formulas = np.char.add(
+                np.char.add(f"={qty_letter}", item_rows.astype(str))[:, None],
+                np.char.add("*", np.array(prices, dtype=float).reshape(len(descriptions), -1).astype(str))
             )
 
-        last_header_col = 5 + len(suppliers) + start_col_offset
-        for col in range(1 + start_col_offset, last_header_col + 1):
-            ws.cell(row=start_row + start_row_offset, column=col).fill = header_fill
+            for i_desc, (desc, row_formulas) in enumerate(zip(descriptions, formulas.tolist())):
+                row = data_row + i_desc + start_row_offset
+                cell(rows, row, 4 + start_col_offset, 1)
+                cell(rows, row, 5 + start_col_offset, desc)
 
-        ws.cell(row=data_row + start_row_offset, column=1 + start_col_offset, value="Brand")
-        ws.cell(row=data_row + start_row_offset, column=2 + start_col_offset, value=brand)
+                for i, formula in enumerate(row_formulas):
+                    col_idx = 6 + i + start_col_offset
+                    cell(rows, row, col_idx, formula)["num_format"] = currency_format
 
-        ws.cell(row=data_row + 1 + start_row_offset, column=1 + start_col_offset, value="Code")
-        ws.cell(row=data_row + 1 + start_row_offset, column=2 + start_col_offset, value=code)
+            cell(rows, tax_row, 5 + start_col_offset, "Tax")
 
-        ws.cell(row=data_row + 2 + start_row_offset, column=1 + start_col_offset, value="Power Type")
-        ws.cell(row=data_row + 2 + start_row_offset, column=2 + start_col_offset, value=power_type)
+            for i in range(len(suppliers)):
+                col_idx = 6 + i + start_col_offset
+                cell(rows, tax_row, col_idx, tax_rate)["num_format"] = percentage_format
 
-        for i_desc, desc in enumerate(descriptions):
-            row = data_row + i_desc + start_row_offset
-            ws.cell(row=row, column=4 + start_col_offset, value=1)
-            ws.cell(row=row, column=5 + start_col_offset, value=desc)
+            cell(rows, total_row, 5 + start_col_offset, "Total")["fill"] = total_fill
 
-            qty_letter = get_column_letter(4 + start_col_offset)
+            first_item_row = data_row + start_row_offset
+            last_item_row = tax_row - 1
 
-            for i, supplier in enumerate(suppliers):
+            for i in range(len(suppliers)):
                 col_idx = 6 + i + start_col_offset
-                price_row = items_for_code[
-                    (items_for_code["supplier"] == supplier) &
-                    (items_for_code["description"] == desc)
-                ]
-                price = float(price_row["price"].iloc[0]) if not price_row.empty else 0
-                ws.cell(row=row, column=col_idx, value=f"={qty_letter}{row}*{price}")
-                ws.cell(row=row, column=col_idx).number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-
-        extra_rows = 2 if "subitem" not in items_for_code["type"].values else 0
-
-        tax_row = data_row + len(descriptions) + extra_rows + start_row_offset
-        ws.cell(row=tax_row, column=5 + start_col_offset, value="Tax")
-
-        for i in range(len(suppliers)):
-            col_idx = 6 + i + start_col_offset
-            ws.cell(row=tax_row, column=col_idx, value=tax_rate)
-            ws.cell(row=tax_row, column=col_idx).number_format = numbers.FORMAT_PERCENTAGE_00
-
-        total_row = tax_row + 1
-        ws.cell(row=total_row, column=5 + start_col_offset, value="Total").fill = total_fill
-
-        first_item_row = data_row + start_row_offset
-        last_item_row = tax_row - 1
-
-        for i in range(len(suppliers)):
-            col_idx = 6 + i + start_col_offset
-            col_letter = get_column_letter(col_idx)
-            ws.cell(
-                row=total_row,
-                column=col_idx,
-                value=f"=SUM({col_letter}{first_item_row}:{col_letter}{last_item_row})*(1+{col_letter}{tax_row})"
-            )
-            ws.cell(row=total_row, column=col_idx).number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-            ws.cell(row=total_row, column=col_idx).fill = total_fill
-
-        first_row = start_row + start_row_offset
-        last_row = total_row
-        first_col = 1 + start_col_offset
-        last_col = 5 + len(suppliers) + start_col_offset
-
-        for r in range(first_row, last_row + 1):
-            for c in range(first_col, last_col + 1):
-                ws.cell(row=r, column=c).border = Border(
-                    top=thin_side if r == first_row else None,
-                    bottom=thin_side if r == last_row else None,
-                    left=thin_side if c == first_col else None,
-                    right=thin_side if c == last_col else None,
+                col_letter = xl_col_to_name(col_idx - 1)
+                total_cell = cell(
+                    rows,
+                    total_row,
+                    col_idx,
+                    f"=SUM({col_letter}{first_item_row}:{col_letter}{last_item_row})*(1+{col_letter}{tax_row})"
                 )
+                total_cell["num_format"] = currency_format
+                total_cell["fill"] = total_fill
+
+            for r in range(first_row, last_row + 1):
+                for c in range(first_col, last_col + 1):
+                    key = (r == first_row, r == last_row, c == first_col, c == last_col)
+                    if any(key):
+                        cell(rows, r, c)["border"] = key
+
+            return first_row, last_row, rows
+
+        current_row = 1
+
+        for group in plan_groups(df):
+            first_row, last_row, rows = build_group_rows(group, current_row)
+
+            # xlsxwriter is zero-indexed
+            for r in range(first_row, last_row + 1):
+                for c, spec in rows[r].items():
+                    fmt = cell_format(spec.get("fill"), spec.get("num_format"), spec.get("border", no_border))
+                    ws.write(r - 1, c - 1, spec.get("value"), fmt)
+
+            current_row = last_row + 3
 
-        current_row = total_row + 3
+        wb.close()
 
-    output = io.BytesIO()
-    wb.save(output)
+        output.seek(0)
+        excel_bytes = output.read()
 
     st.download_button(
         "Download Excel",
-        data=output.getvalue(),
+        data=excel_bytes,
         file_name=f"output_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
     )
 
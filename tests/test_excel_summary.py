@@ -0,0 +1,97 @@
+import io
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import streamlit as st
+from openpyxl import load_workbook
+from streamlit.testing.v1 import AppTest
+
+APP = Path(__file__).resolve().parents[1] / "excel_summary_19.py"
+
+COLUMNS = "type,supplier,brand,code,description,Power Type,price\n"
+TEXT_COLS = ["type", "supplier", "brand", "code", "description", "Power Type"]
+
+
+def load_csv(rows):
+    df = pd.read_csv(io.StringIO(COLUMNS + rows))
+    df[TEXT_COLS] = df[TEXT_COLS].astype("string[pyarrow]").apply(lambda s: s.str.strip())
+    return df
+
+
+def run_app(df):
+    at = AppTest.from_file(str(APP), default_timeout=60)
+    at.secrets["power_automate"] = {"url": "http://localhost/flow"}
+    at.session_state["df"] = df
+    at.run()
+    assert not at.exception
+    return at
+
+
+def preview_html(at):
+    return "".join(el.proto.srcdoc for el in at.get("iframe"))
+
+
+@pytest.fixture
+def excel_sheet(monkeypatch):
+    downloads = []
+    monkeypatch.setattr(st, "download_button", lambda label, data, **kwargs: downloads.append(data))
+
+    def generate(at):
+        next(b for b in at.button if b.label == "Generate Excel File").click().run()
+        assert not at.exception
+        return load_workbook(io.BytesIO(downloads[-1]))["Items Summary"]
+
+    return generate
+
+
+def test_group_without_prices(excel_sheet):
+    at = run_app(load_csv(
+        "item,SupA,B,C1,D,110V,10\n"
+        "item,SupA,B,C2,G,110V,\n"
+    ))
+
+    html = preview_html(at)
+    assert "<b>Code</b><br>C2" in html
+    assert "<td>$0.00</td>" in html
+
+    ws = excel_sheet(at)
+    formulas = [c.value for row in ws.iter_rows() for c in row if isinstance(c.value, str)]
+    assert "=E3*10.0" in formulas
+    assert "=E12*0.0" in formulas
+
+
+def test_missing_brand(excel_sheet):
+    at = run_app(load_csv("item,SupA,,C1,D,110V,10\n"))
+
+    ws = excel_sheet(at)
+    assert ws["B3"].value == "Brand"
+    assert ws["C3"].value is None
+    assert ws["G3"].value == "=E3*10.0"
+
+
+def test_groups_without_quotes_are_skipped_in_preview_only(excel_sheet):
+    at = run_app(load_csv(
+        "item,SupA,B,C1,D,110V,10\n"
+        "item,,B,C2,G,110V,\n"
+        "item,SupA,B,C3,,220V,5\n"
+    ))
+
+    html = preview_html(at)
+    assert html.count("<table>") == 1
+    assert "<b>Code</b><br>C1" in html
+
+    ws = excel_sheet(at)
+    codes = [c.value for row in ws.iter_rows() for c in row if c.column_letter == "C"]
+    assert {"C1", "C2", "C3"} <= set(codes)
+
+
+def test_source_column_named_index_keeps_row_order():
+    df = load_csv(
+        "item,SupA,B,C1,D,110V,10\n"
+        "item,SupB,B,C1,D,110V,12\n"
+    )
+    df.insert(0, "index", [1, 0])
+
+    html = preview_html(run_app(df))
+    assert html.index("<th>SupA</th>") < html.index("<th>SupB</th>")